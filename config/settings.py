@@ -57,7 +57,6 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
-                "patients.context_processors.notifications_badge",
             ],
         },
     },
@@ -77,6 +76,17 @@ DATABASES = {
     }
 }
 
+# Cache
+# Shared by every worker, so per-user invalidation (Notification.forget_badge_counts)
+# reaches all processes; the default per-process LocMemCache would keep serving stale
+# badge/status counts from workers that didn't handle the write. Needs the `redis` package.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ.get('REDIS_URL', 'redis://localhost:6379/1'),  # load from .env
+    }
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
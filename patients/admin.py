@@ -1,4 +1,6 @@
 from datetime import date, datetime, time, timedelta
+from functools import cached_property, reduce
+from operator import or_
 from typing import TYPE_CHECKING
 
 from django import forms
@@ -7,15 +9,26 @@ from django.contrib import admin, messages
 from django.contrib.admin import SimpleListFilter
 from django.contrib.admin.helpers import ActionForm
 from django.contrib.admin.sites import NotRegistered
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth import get_user_model
-from django.db import transaction
-from django.db.models import Exists, OuterRef
+from django.contrib.auth.admin import UserAdmin as DjangoUserAdmin
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connection, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.db.models import (
+    Case, CharField, Count, Exists, F, Func, IntegerField, OuterRef, Q, Value, When,
+)
+from django.db.models.functions import Coalesce, Length, Substr
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from django.urls import path
+from django.http import HttpResponseRedirect
 from django.shortcuts import redirect
 from django.utils.html import format_html
+from django.utils.text import smart_split, unescape_string_literal
 
 from .models import (
     Patient, PatientStatus, Signout, Todo, OvernightEvent,
@@ -41,29 +54,102 @@ def _calc_age(dob: date | None) -> int | None:
 def _calc_los(admit_date: date | None, admit_time: time | None) -> int | None:
     if not admit_date:
         return None
-    if admit_time:
-        admit_dt = datetime.combine(admit_date, admit_time, tzinfo=timezone.get_current_timezone())
-    else:
-        admit_dt = datetime.combine(admit_date, datetime.min.time(), tzinfo=timezone.get_current_timezone())
+    if not admit_time:
+        # Midnight admit: whole days is just the local calendar-day difference
+        return (timezone.localdate() - admit_date).days
+    admit_dt = datetime.combine(admit_date, admit_time, tzinfo=timezone.get_current_timezone())
     return (timezone.now() - admit_dt).days
 
+# SQL-side equivalents of _calc_age/_calc_los (PostgreSQL), so the changelist gets
+# them as plain columns and can ORDER BY them in the database.
+class AgeYears(Func):
+    """Whole years from a date to today (same rule as _calc_age)."""
+    template = "EXTRACT(YEAR FROM AGE(CURRENT_DATE, %(expressions)s))::integer"
+    output_field = IntegerField()
+
+class DaysSinceLocal(Func):
+    """Whole days from a local (date, time) pair to now (same rule as _calc_los)."""
+    template = "EXTRACT(DAY FROM NOW() - (%(expressions)s))::integer"
+    arg_joiner = " AT TIME ZONE "
+    output_field = IntegerField()
+
+    def __init__(self, date_field: str, time_field: str, **extra):
+        local_ts = Func(
+            F(date_field),
+            Coalesce(F(time_field), Value(time.min)),
+            template="(%(expressions)s)",
+            arg_joiner=" + ",
+        )
+        super().__init__(local_ts, Value(timezone.get_current_timezone_name()), **extra)
+
+class ToChar(Func):
+    function = "TO_CHAR"
+    output_field = CharField()
+
+def _admit_text(date_field: str, time_field: str) -> Case:
+    """'YYYY-MM-DD HH:MM', or just the date when there's no time (same as admit_display)."""
+    return Case(
+        When(**{f"{time_field}__isnull": True}, then=ToChar(F(date_field), Value("YYYY-MM-DD"))),
+        default=ToChar(
+            Func(F(date_field), F(time_field), template="(%(expressions)s)", arg_joiner=" + "),
+            Value("YYYY-MM-DD HH24:MI"),
+        ),
+    )
+
+# Placeholder attending ("TO BE ASSIGNED"). Its pk never changes after migrations,
+# so look it up once per process instead of on every action/add-form render.
+_TBA_CACHE: dict[str, int] = {}
+
+def _tba_user_pk() -> int | None:
+    pk = _TBA_CACHE.get("pk")
+    if pk is None:
+        pk = UserModel.objects.filter(username="to_be_assigned").values_list("pk", flat=True).first()
+        if pk is not None:
+            _TBA_CACHE["pk"] = pk
+    return pk
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def _invalidate_tba_cache(sender, instance, **kwargs):
+    # Renamed/deleted placeholder (or a new one created) -> re-resolve on next use
+    if instance.pk == _TBA_CACHE.get("pk") or instance.username == "to_be_assigned":
+        _TBA_CACHE.clear()
+
+# Bulk actions: rewrite "select all" querysets to pk lists and write in bounded chunks,
+# so each UPDATE is "WHERE id IN (...)" rather than "WHERE id IN (SELECT ... joins)".
+BULK_BATCH_SIZE = 1000
+
+def _pk_batches(queryset, size: int = BULK_BATCH_SIZE):
+    pks = list(queryset.values_list("pk", flat=True))
+    for i in range(0, len(pks), size):
+        yield pks[i:i + size]
+
+def _batched_update(queryset, **values) -> int:
+    """queryset.update(**values), one pk chunk at a time. Returns rows updated."""
+    model = queryset.model
+    return sum(model.objects.filter(pk__in=batch).update(**values) for batch in _pk_batches(queryset))
+
 # Quiet hours config (defaults: 16 → 7)
 QUIET_START_HOUR = getattr(settings, "NOTIFY_QUIET_START_HOUR", 16)  # 4 PM local
 QUIET_END_HOUR = getattr(settings, "NOTIFY_QUIET_END_HOUR", 7)       # 7 AM local
 
-def _is_quiet_hours(now: timezone.datetime) -> bool:
-    """Return True if local hour is within quiet window."""
-    local_now = timezone.localtime(now)
-    h = local_now.hour
-    start = QUIET_START_HOUR
-    end = QUIET_END_HOUR
+def _quiet_hours_mask(start: int, end: int) -> int:
+    """Bit h is set when local hour h falls in the quiet window."""
     if start == end:
-        return False
+        return 0
     if start < end:
         # same-day window (e.g., 9→17)
-        return start <= h < end
-    # overnight window (e.g., 16→7)
-    return h >= start or h < end
+        hours = range(start, end)
+    else:
+        # overnight window (e.g., 16→7)
+        hours = [h for h in range(24) if h >= start or h < end]
+    return sum(1 << h for h in hours)
+
+_QUIET_MASK = _quiet_hours_mask(QUIET_START_HOUR, QUIET_END_HOUR)
+
+def _is_quiet_hours(now: timezone.datetime) -> bool:
+    """Return True if local hour is within quiet window."""
+    return bool((_QUIET_MASK >> timezone.localtime(now).hour) & 1)
 
 def _next_visible_time(now: timezone.datetime) -> timezone.datetime:
     """
@@ -78,6 +164,13 @@ def _next_visible_time(now: timezone.datetime) -> timezone.datetime:
     naive = datetime.combine(deliver_date, time(hour=QUIET_END_HOUR, minute=0))
     return timezone.make_aware(naive, tz)
 
+_REL_ATTRS = ("can_add_related", "can_change_related", "can_delete_related")
+
+def _disable_related(widget) -> None:
+    """Hide the add/change/delete related-object icons on an FK widget."""
+    for attr in _REL_ATTRS:
+        setattr(widget, attr, False)
+
 # ========== Inlines ==========
 
 class SignoutInline(admin.StackedInline):
@@ -88,6 +181,10 @@ class SignoutInline(admin.StackedInline):
     show_change_link = True
     ordering = ("entry_date",)   # Oldest first
 
+    # Rows render created_by + a change link (__str__ reads patient.mrn); join both up front
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("patient", "created_by")
+
     def formfield_for_dbfield(self, db_field, **kwargs):
         formfield = super().formfield_for_dbfield(db_field, **kwargs)
         if db_field.name == "text":
@@ -102,6 +199,9 @@ class TodoInline(admin.TabularInline):
     readonly_fields = ("completed_at", "created_by")
     show_change_link = True
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("patient", "created_by")
+
 class OvernightEventInline(admin.TabularInline):
     model = OvernightEvent
     extra = 0
@@ -109,59 +209,60 @@ class OvernightEventInline(admin.TabularInline):
     readonly_fields = ("created_at",)
     show_change_link = True
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("patient")
+
 class AssignmentInline(admin.TabularInline):
     model = Assignment
     extra = 1
     fields = ("provider", "role", "start_date", "end_date")
     show_change_link = True
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("patient", "provider")
+
     # Hide add/change/delete related buttons on the provider FK inside the inline
     def get_formset(self, request, obj=None, **kwargs):
         formset = super().get_formset(request, obj, **kwargs)
         form = formset.form
         if "provider" in form.base_fields:
-            w = form.base_fields["provider"].widget
-            for attr in ("can_add_related", "can_change_related", "can_delete_related"):
-                if hasattr(w, attr):
-                    setattr(w, attr, False)
+            _disable_related(form.base_fields["provider"].widget)
         return formset
 
 # ========== Custom Filters ==========
 
+_STATUS_LOOKUPS = (
+    (PatientStatus.ACTIVE, _("Active")),
+    (PatientStatus.DISCHARGED, _("Discharged")),
+    (PatientStatus.ARCHIVED, _("Archived")),
+)
+_VALID_STATUSES = frozenset(value for value, _label in _STATUS_LOOKUPS)
+
 class StatusListFilter(SimpleListFilter):
     title = _("Status")
     parameter_name = "status__exact"
 
     def lookups(self, request, model_admin):
-        return [
-            (PatientStatus.ACTIVE, _("Active")),
-            (PatientStatus.DISCHARGED, _("Discharged")),
-            (PatientStatus.ARCHIVED, _("Archived")),
-        ]
+        return _STATUS_LOOKUPS
 
     def queryset(self, request, queryset):
         value = self.value()
-        if value in {PatientStatus.ACTIVE, PatientStatus.DISCHARGED, PatientStatus.ARCHIVED}:
+        if value in _VALID_STATUSES:
             return queryset.filter(status=value)
         return queryset
 
 class MyWatchlistFilter(SimpleListFilter):
     parameter_name = "my_watch"
 
+    title = "My watchlist"
+
     def __init__(self, request, *args, **kwargs):
         # keep request so we can compute per-user counts and title
         self.request = request
         super().__init__(request, *args, **kwargs)
-
-    @property
-    def title(self):
-        # Sidebar header shows total active items on *my* watchlist
-        from .models import PatientWatch
-        total = PatientWatch.objects.filter(
-            user=self.request.user,
-            archived_at__isnull=True,
-        ).count()
-        return f"My watchlist ({total})"
+        # Sidebar header shows total active items on *my* watchlist. lookups()
+        # counts over every patient, so its "yes" count is that total already.
+        self.title = f"My watchlist ({self._watch_total})"
 
     def lookups(self, request, model_admin):
         """
@@ -170,22 +271,14 @@ class MyWatchlistFilter(SimpleListFilter):
         """
         base_qs = model_admin.get_queryset(request)
 
-        yes_count = (
-            base_qs.filter(
-                watchers__user=request.user,
-                watchers__archived_at__isnull=True,
-            )
-            .distinct()
-            .count()
-        )
-        no_count = (
-            base_qs.exclude(
-                watchers__user=request.user,
-                watchers__archived_at__isnull=True,
-            )
-            .distinct()
-            .count()
+        # One pass over the _on_my_watch EXISTS annotation instead of two
+        # COUNT(DISTINCT) queries over a LEFT JOIN on PatientWatch.
+        counts = base_qs.aggregate(
+            yes=Count("pk", filter=Q(_on_my_watch=True)),
+            no=Count("pk", filter=Q(_on_my_watch=False)),
         )
+        yes_count, no_count = counts["yes"], counts["no"]
+        self._watch_total = yes_count
 
         return [
             ("yes", f"Yes ({yes_count})"),
@@ -193,16 +286,11 @@ class MyWatchlistFilter(SimpleListFilter):
         ]
 
     def queryset(self, request, queryset):
+        # Reuse the _on_my_watch EXISTS annotation from PatientAdmin.get_queryset
         if self.value() == "yes":
-            return queryset.filter(
-                watchers__user=request.user,
-                watchers__archived_at__isnull=True,
-            )
+            return queryset.filter(_on_my_watch=True)
         if self.value() == "no":
-            return queryset.exclude(
-                watchers__user=request.user,
-                watchers__archived_at__isnull=True,
-            )
+            return queryset.filter(_on_my_watch=False)
         return queryset
 
 
@@ -213,23 +301,43 @@ class PatientWatchAdmin(admin.ModelAdmin):
     list_display = ("patient", "user", "note", "created_at", "archived_at")
     list_filter = ("user", ("archived_at", admin.EmptyFieldListFilter))
     search_fields = ("patient__mrn", "patient__name", "user__username", "note")
+    list_select_related = ("patient", "user")
     ordering = ("-created_at",)
 
+def _add_to_watchlist(user, queryset) -> tuple[int, int, int]:
+    """
+    Set-based "watch these patients" for one user: one SELECT of existing watches,
+    one UPDATE to reactivate the newest archived one per patient, one bulk INSERT
+    for the rest.
+    Returns (created, reactivated, skipped_already_active).
+    """
+    patient_ids = list(queryset.values_list("pk", flat=True))
+    active, archived = set(), set()
+    for pid, archived_at in PatientWatch.objects.filter(
+        user=user, patient_id__in=patient_ids
+    ).values_list("patient_id", "archived_at"):
+        (archived if archived_at else active).add(pid)
+    archived -= active
+
+    if archived:
+        # Only one watch per (user, patient) may be active: reactivate just the newest
+        # archived row per patient (DISTINCT ON), leaving older history archived.
+        newest = (
+            PatientWatch.objects.filter(user=user, patient_id__in=archived, archived_at__isnull=False)
+            .order_by("patient_id", "-archived_at", "-pk")
+            .distinct("patient_id")
+            .values("pk")
+        )
+        PatientWatch.objects.filter(pk__in=newest).update(archived_at=None)
+    missing = [pid for pid in patient_ids if pid not in active and pid not in archived]
+    PatientWatch.objects.bulk_create(
+        [PatientWatch(user=user, patient_id=pid, note="") for pid in missing]
+    )
+    return len(missing), len(archived), len(active)
+
 @admin.action(description="Add to MY watchlist")
 def add_to_my_watchlist(modeladmin, request, queryset):
-    created, reactivated, skipped = 0, 0, 0
-    for patient in queryset:
-        if PatientWatch.objects.filter(user=request.user, patient=patient, archived_at__isnull=True).exists():
-            skipped += 1
-            continue
-        if PatientWatch.objects.filter(user=request.user, patient=patient, archived_at__isnull=False).exists():
-            PatientWatch.objects.filter(
-                user=request.user, patient=patient, archived_at__isnull=False
-            ).update(archived_at=None)
-            reactivated += 1
-            continue
-        PatientWatch.objects.create(user=request.user, patient=patient, note="")
-        created += 1
+    created, reactivated, skipped = _add_to_watchlist(request.user, queryset)
 
     modeladmin.message_user(
         request,
@@ -248,9 +356,112 @@ def remove_from_my_watchlist(modeladmin, request, queryset):
 
 # ========== Patients Admin (with Attending FK + Bulk Action + Lifecycle) ==========
 
+class PatientChangeList(ChangeList):
+    """
+    Changelist-only projection: the list renders ~10 columns, so don't pull the
+    wide text fields. Applied in get_results() so it only shapes the rendered
+    page — actions receive get_queryset() and still get full rows to save().
+    """
+    LIST_FIELDS = (
+        "id", "mrn", "name", "dob", "location",
+        "attending_id", "attending__username", "attending__first_name", "attending__last_name",
+        "admission_date", "admission_time", "status", "discharged_at", "archived_at",
+    )
+
+    def get_results(self, request):
+        self.queryset = self.queryset.select_related("attending").only(*self.LIST_FIELDS)
+        super().get_results(request)
+
+class TextHeadChangeList(ChangeList):
+    """
+    Changelist-only projection for a long text column: the list renders a short
+    preview, so fetch its first `head_len` chars (as _<field>_head) and length
+    (as _<field>_len) and defer the body. Like PatientChangeList, applied in
+    get_results() so change forms (get_object) and actions still load full rows.
+    """
+    text_field = ""
+    head_len = 60
+
+    def get_results(self, request):
+        f = self.text_field
+        self.queryset = self.queryset.annotate(
+            **{f"_{f}_head": Substr(f, 1, self.head_len), f"_{f}_len": Length(f)}
+        ).defer(f)
+        super().get_results(request)
+
+class TodoChangeList(TextHeadChangeList):
+    text_field = "text"
+
+class OvernightEventChangeList(TextHeadChangeList):
+    text_field = "description"
+
+class NotificationChangeList(TextHeadChangeList):
+    text_field = "message"
+    head_len = 80
+
+# The action bar renders on every changelist GET; keep its attending dropdown in cache
+ATTENDING_CHOICES_CACHE_KEY = "patients:active_attending_choices"
+ATTENDING_CHOICES_TTL = 300  # seconds
+
+def _attending_choices():
+    def fetch():
+        return list(
+            UserModel.objects.filter(is_active=True)
+            .order_by("last_name", "first_name", "username")
+            .values_list("pk", "username")
+        )
+    return [("", "---------")] + cache.get_or_set(ATTENDING_CHOICES_CACHE_KEY, fetch, ATTENDING_CHOICES_TTL)
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def _invalidate_attending_choices(sender, instance, **kwargs):
+    cache.delete(ATTENDING_CHOICES_CACHE_KEY)
+
+class PkPagePaginator(Paginator):
+    """
+    Changelist paginator for large tables: pages past the first fetch rows via
+    "pk IN (SELECT pk ... OFFSET/LIMIT)", so the OFFSET walk runs over the narrow
+    pk-only subquery instead of full rows. COUNT(*) stays exact.
+    """
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if number == 1:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        rows = self.object_list.filter(pk__in=self.object_list.values("pk")[bottom:top])
+        return self._get_page(rows, number, self)
+
+class EstimatedCountPaginator(PkPagePaginator):
+    """
+    For append-heavy logs (notifications, audit): an unfiltered list uses the planner's
+    row estimate (pg_class.reltuples) instead of COUNT(*) once the table is big enough
+    for that to matter. Filtered lists (and small or never-analyzed tables) count exactly.
+    """
+    ESTIMATE_MIN_ROWS = 10_000
+
+    @cached_property
+    def count(self):
+        query = self.object_list.query
+        if not query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [query.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] >= self.ESTIMATE_MIN_ROWS:
+                return row[0]
+        return super().count
+
 class SetAttendingActionForm(ActionForm):
-    attending = forms.ModelChoiceField(
-        queryset=UserModel.objects.filter(is_active=True).order_by("last_name", "first_name", "username"),
+    attending = forms.TypedChoiceField(
+        choices=_attending_choices,
+        coerce=int,
+        empty_value=None,
         required=False,
         label="Assign attending"
     )
@@ -309,7 +520,9 @@ class PatientAdmin(admin.ModelAdmin):
         "attending__first_name",
         "attending__last_name",
     )
+    search_help_text = "Search by MRN, patient name, diagnosis, or attending."
     list_select_related = ("attending",)
+    paginator = PkPagePaginator
     date_hierarchy = "admission_date"
     ordering = ("-admission_date", "-admission_time")
     autocomplete_fields = ("attending",)
@@ -335,29 +548,15 @@ class PatientAdmin(admin.ModelAdmin):
         }),
     )
 
-    # --- NEW: Age display column (computed from model property) ---
-    @admin.display(description="Age", ordering="dob")
+    # --- NEW: Age display column (annotated in get_queryset; property as fallback) ---
+    @admin.display(description="Age", ordering="_age_years")
     def age_display(self, obj: "Patient"):
-        return obj.age_years
-
-    actions = ["add_to_my_watchlist_inline", "remove_from_my_watchlist_inline"]
+        return obj._age_years if hasattr(obj, "_age_years") else obj.age_years
 
     # ---------- Watchlist bulk actions ----------
     @admin.action(description="➕ Add selected to *my* watchlist")
     def add_to_my_watchlist_inline(self, request, queryset):
-        from django.utils import timezone
-        from .models import PatientWatch
-        created, reactivated = 0, 0
-        for patient in queryset:
-            qs = PatientWatch.objects.filter(user=request.user, patient=patient)
-            if qs.filter(archived_at__isnull=True).exists():
-                continue
-            if qs.filter(archived_at__isnull=False).exists():
-                qs.update(archived_at=None)
-                reactivated += 1
-                continue
-            PatientWatch.objects.create(user=request.user, patient=patient, note="")
-            created += 1
+        created, reactivated, _skipped = _add_to_watchlist(request.user, queryset)
         self.message_user(
             request,
             f"Added to your watchlist — created: {created}, reactivated: {reactivated}.",
@@ -369,8 +568,7 @@ class PatientAdmin(admin.ModelAdmin):
         from django.utils import timezone
         from .models import PatientWatch
         qs = PatientWatch.objects.filter(user=request.user, patient__in=queryset, archived_at__isnull=True)
-        count = qs.count()
-        qs.update(archived_at=timezone.now())
+        count = qs.update(archived_at=timezone.now())
         self.message_user(request, f"Removed {count} patient(s) from your watchlist.", level=messages.SUCCESS)
 
     # ---------- Quick toggle: Watch / Unwatch (per-row link) ----------
@@ -391,23 +589,27 @@ class PatientAdmin(admin.ModelAdmin):
         from django.utils import timezone
         from .models import Patient, PatientWatch
 
-        patient = Patient.objects.filter(pk=patient_id).first()
+        patient = Patient.objects.filter(pk=patient_id).values("name").first()
         if not patient:
             return redirect(request.META.get("HTTP_REFERER", ".."))
+        name = patient["name"]
 
-        qs = PatientWatch.objects.filter(user=request.user, patient=patient)
-        # If active exists -> archive it (unwatch)
-        if qs.filter(archived_at__isnull=True).exists():
-            qs.update(archived_at=timezone.now())
-            self.message_user(request, f"Removed {patient.name} from your watchlist.", level=messages.SUCCESS)
-        # Else if archived exists -> reactivate
-        elif qs.filter(archived_at__isnull=False).exists():
-            qs.update(archived_at=None)
-            self.message_user(request, f"Re-added {patient.name} to your watchlist.", level=messages.SUCCESS)
+        qs = PatientWatch.objects.filter(user=request.user, patient_id=patient_id)
+        # Active watch -> archive it (unwatch)
+        if qs.filter(archived_at__isnull=True).update(archived_at=timezone.now()):
+            self.message_user(request, f"Removed {name} from your watchlist.", level=messages.SUCCESS)
+            return redirect(request.META.get("HTTP_REFERER", ".."))
+
+        # Else reactivate the newest archived watch; only one row may be active
+        # (uniq_active_watch_per_user_patient), so older history stays archived.
+        latest = qs.order_by("-archived_at", "-pk").values_list("pk", flat=True).first()
+        if latest is not None:
+            PatientWatch.objects.filter(pk=latest).update(archived_at=None)
+            self.message_user(request, f"Re-added {name} to your watchlist.", level=messages.SUCCESS)
         # Else create new
         else:
-            PatientWatch.objects.create(user=request.user, patient=patient, note="")
-            self.message_user(request, f"Added {patient.name} to your watchlist.", level=messages.SUCCESS)
+            PatientWatch.objects.create(user=request.user, patient_id=patient_id, note="")
+            self.message_user(request, f"Added {name} to your watchlist.", level=messages.SUCCESS)
 
         # Go back to wherever you came from (keeps filters/sorting)
         return redirect(request.META.get("HTTP_REFERER", ".."))
@@ -425,6 +627,9 @@ class PatientAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         qs = super().get_queryset(request)
         return qs.annotate(
+            _age_years=AgeYears("dob"),
+            _los_days=DaysSinceLocal("admission_date", "admission_time"),
+            _admit_display=_admit_text("admission_date", "admission_time"),
             _on_my_watch=Exists(
                 PatientWatch.objects.filter(
                     user=request.user,
@@ -434,59 +639,115 @@ class PatientAdmin(admin.ModelAdmin):
             )
         )
 
+    def get_changelist(self, request, **kwargs):
+        return PatientChangeList
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Same per-term ICONTAINS matching as the default search, but the attending__
+        fields are resolved against the small user table first. Each term then
+        becomes OR'd predicates on patient columns only (trigram indexes plus
+        attending_id = ANY(...)), instead of ILIKEs across a JOIN that force a
+        sequential scan of patients.
+        """
+        if not search_term:
+            return queryset, False
+        own_fields = [f for f in self.search_fields if not f.startswith("attending__")]
+        user_fields = [f.removeprefix("attending__") for f in self.search_fields if f.startswith("attending__")]
+        for bit in smart_split(search_term):
+            if bit.startswith(('"', "'")) and bit[0] == bit[-1]:
+                bit = unescape_string_literal(bit)
+            attending_ids = list(
+                UserModel.objects.filter(
+                    reduce(or_, (Q(**{f"{f}__icontains": bit}) for f in user_fields))
+                ).values_list("pk", flat=True)
+            )
+            term = Q(attending_id__in=attending_ids)
+            for f in own_fields:
+                term |= Q(**{f"{f}__icontains": bit})
+            queryset = queryset.filter(term)
+        return queryset, False
+
     @admin.display(boolean=True, description="My watch?")
     def on_my_watchlist(self, obj):
         return bool(getattr(obj, "_on_my_watch", False))
 
     def changelist_view(self, request, extra_context=None):
-        if "status__exact" not in request.GET:
-            ref = request.META.get("HTTP_REFERER", "")
-            # If landing fresh (no referrer) and no explicit filter, default to Active
-            if not ref:
-                q = request.GET.copy()
-                q["status__exact"] = PatientStatus.ACTIVE
-                request.GET = q
-                request.META["QUERY_STRING"] = q.urlencode()
+        # If landing fresh (no referrer) and no explicit filter, redirect to the Active
+        # view rather than rewriting request.GET in place; the filtered URL is then
+        # what the browser keeps (and what any form on the page posts back to).
+        if (
+            request.method == "GET"
+            and "status__exact" not in request.GET
+            and not request.META.get("HTTP_REFERER")
+        ):
+            q = request.GET.copy()
+            q["status__exact"] = PatientStatus.ACTIVE
+            return HttpResponseRedirect(f"{request.path}?{q.urlencode()}")
         return super().changelist_view(request, extra_context=extra_context)
 
     # ---------- Notification helpers ----------
-    def _notify_assignment(self, patient: "Patient", new_attending: "User") -> None:
+    def _notify_assignments(self, pairs: list[tuple["Patient", "User"]]) -> None:
         """
-        Create/queue a notification to the assigned hospitalist.
+        Create/queue notifications to the assigned hospitalists, one per
+        (patient, new_attending) pair, in one DELETE per recipient + one bulk INSERT.
 
         Dedupe rule:
           - Remove any *pending* (future-visible) assignment notifications
             for this same patient/recipient so only the final pre-7AM
             assignment fires (quiet-hours consolidation).
+          - The uniq_pending_assign_notif constraint backs this up: if a concurrent
+            assignment already queued the same notification, the insert is skipped.
         """
         now = timezone.now()
         visible_at = _next_visible_time(now)
 
-        # 1) Cancel any pending overnight assignment notifications for this patient+recipient
-        Notification.objects.filter(
-            recipient=new_attending,
-            patient=patient,
-            category=Notification.Category.ASSIGNMENT,
-            visible_at__gt=now,        # future-visible (e.g., next 7 AM)
-            read_at__isnull=True,
-        ).delete()
-
-        # 2) Push the latest assignment notification (respecting quiet hours)
-        msg = (
-            f"New patient assigned to you: {patient.mrn or '—'} — {patient.name}."
-            f" Location: {patient.location or '—'}."
-            f" Dx: {patient.diagnosis or '—'}."
-        )
-        Notification.push(
-            recipient=new_attending,
-            message=msg,
-            level=Notification.Level.INFO,
-            patient=patient,
-            visible_at=visible_at,
-            category=Notification.Category.ASSIGNMENT,   # CHANGED from kind
-        )
+        # 1) Cancel any pending overnight assignment notifications for these patient+recipient pairs
+        patient_ids_by_recipient: dict[int, list[int]] = {}
+        for patient, new_attending in pairs:
+            patient_ids_by_recipient.setdefault(new_attending.pk, []).append(patient.pk)
+        with transaction.atomic():
+            for recipient_id, patient_ids in patient_ids_by_recipient.items():
+                Notification.objects.filter(
+                    recipient_id=recipient_id,
+                    patient_id__in=patient_ids,
+                    category=Notification.Category.ASSIGNMENT,
+                    visible_at__gt=now,        # future-visible (e.g., next 7 AM)
+                    read_at__isnull=True,
+                ).delete()
+
+            # 2) Push the latest assignment notifications (respecting quiet hours)
+            Notification.push_many([
+                dict(
+                    recipient_id=new_attending.pk,
+                    message=(
+                        f"New patient assigned to you: {patient.mrn or '—'} — {patient.name}."
+                        f" Location: {patient.location or '—'}."
+                        f" Dx: {patient.diagnosis or '—'}."
+                    ),
+                    level=Notification.Level.INFO,
+                    patient_id=patient.pk,
+                    visible_at=visible_at,
+                    category=Notification.Category.ASSIGNMENT,
+                )
+                for patient, new_attending in pairs
+            ], ignore_conflicts=True)
+
+    def _queue_assignment_notifications(self, pairs) -> None:
+        """
+        Notify new attendings (never the placeholder) once the surrounding transaction
+        commits, so the patient row lock isn't held across the notification writes and
+        a rolled-back save sends nothing. Outside a transaction this runs immediately.
+        """
+        pairs = [(p, u) for p, u in pairs if getattr(u, "username", None) != "to_be_assigned"]
+        if pairs:
+            transaction.on_commit(lambda: self._notify_assignments(pairs))
 
     # ---------- Lifecycle Admin Actions ----------
+    # These stay set-based UPDATEs: no receiver reacts to status changes, and
+    # bulk_update() wouldn't dispatch post_save either. What update() does skip is
+    # auto_now, so updated_at is stamped explicitly. Rows already in the target
+    # state are excluded so they aren't rewritten (and keep their timestamps).
     action_form = SetAttendingActionForm
     actions = [
         "bulk_set_or_clear_attending",
@@ -499,19 +760,27 @@ class PatientAdmin(admin.ModelAdmin):
 
     @admin.action(description="Mark Active (clear discharge/archive timestamps)")
     def mark_active(self, request, queryset):
-        updated = queryset.update(
+        updated = _batched_update(
+            queryset.exclude(
+                status=PatientStatus.ACTIVE,
+                discharged_at__isnull=True,
+                archived_at__isnull=True,
+            ),
             status=PatientStatus.ACTIVE,
             discharged_at=None,
             archived_at=None,
+            updated_at=timezone.now(),
         )
         self.message_user(request, f"Marked {updated} patient(s) as ACTIVE.", level=messages.SUCCESS)
 
     @admin.action(description="Discharge now (sets discharged_at=now)")
     def discharge_now(self, request, queryset):
         now = timezone.now()
-        updated = queryset.update(
+        updated = _batched_update(
+            queryset.exclude(status=PatientStatus.DISCHARGED),
             status=PatientStatus.DISCHARGED,
             discharged_at=now,
+            updated_at=now,
         )
         grace = getattr(settings, "PATIENT_DISCHARGE_GRACE_DAYS", 7)
         self.message_user(
@@ -523,21 +792,59 @@ class PatientAdmin(admin.ModelAdmin):
     @admin.action(description="Archive now (sets archived_at=now)")
     def archive_now(self, request, queryset):
         now = timezone.now()
-        updated = queryset.update(
+        updated = _batched_update(
+            queryset.exclude(status=PatientStatus.ARCHIVED),
             status=PatientStatus.ARCHIVED,
             archived_at=now,
+            updated_at=now,
         )
         self.message_user(request, f"Archived {updated} patient(s).", level=messages.SUCCESS)
 
+    def _set_attending(self, request, queryset, target_pk: int) -> list["Patient"]:
+        """
+        Point the selected patients at target_pk with one UPDATE per pk chunk.
+        Returns the patients that actually changed (fields used by notifications loaded).
+
+        update() bypasses the post_save audit receiver, so the ATTENDING_CHANGED rows
+        it would have written are bulk-inserted here in the same transaction.
+        """
+        now = timezone.now()
+        changed = []
+        for batch in _pk_batches(queryset.exclude(attending_id=target_pk)):
+            with transaction.atomic():
+                rows = list(
+                    Patient.objects.filter(pk__in=batch)
+                    .exclude(attending_id=target_pk)
+                    .select_for_update()
+                    .only("pk", "mrn", "name", "location", "diagnosis", "attending_id")
+                )
+                Patient.objects.filter(pk__in=[p.pk for p in rows]).update(
+                    attending_id=target_pk, updated_at=now,
+                )
+                AuditLog.objects.bulk_create([
+                    AuditLog(
+                        event=AuditLog.Event.ATTENDING_CHANGED,
+                        patient_id=p.pk,
+                        changed_by=request.user,
+                        old_attending_id=p.attending_id,
+                        new_attending_id=target_pk,
+                        created_at=now,
+                    )
+                    for p in rows
+                ])
+            for p in rows:
+                p.attending_id = target_pk
+            changed.extend(rows)
+        return changed
+
     @admin.action(description="Set/Clear Attending for selected patients")
     def bulk_set_or_clear_attending(self, request, queryset):
         attending_id = request.POST.get("attending")
         clear = request.POST.get("clear_attending")
 
         # Resolve placeholder user
-        try:
-            tba_user = UserModel.objects.get(username="to_be_assigned")
-        except UserModel.DoesNotExist:
+        tba_pk = _tba_user_pk()
+        if tba_pk is None:
             self.message_user(
                 request,
                 "Placeholder user 'to_be_assigned' was not found. Please run migrations again.",
@@ -547,14 +854,7 @@ class PatientAdmin(admin.ModelAdmin):
 
         # CLEAR: set to placeholder (no notification sent)
         if clear:
-            with transaction.atomic():
-                updated = 0
-                for p in queryset.select_for_update():
-                    if p.attending_id != tba_user.id:
-                        p._changed_by_user = request.user  # ensure audit 'changed_by'
-                        p.attending = tba_user
-                        p.save(update_fields=["attending"])
-                        updated += 1
+            updated = len(self._set_attending(request, queryset, tba_pk))
             self.message_user(
                 request,
                 f"Set Attending to TO BE ASSIGNED on {updated} patient(s).",
@@ -565,21 +865,15 @@ class PatientAdmin(admin.ModelAdmin):
         # ASSIGN: set to selected user and notify them
         if attending_id:
             try:
-                user = UserModel.objects.get(pk=attending_id)
+                # Only what the notifications and message below read
+                user = UserModel.objects.only("pk", "username", "first_name", "last_name").get(pk=attending_id)
             except UserModel.DoesNotExist:
                 self.message_user(request, "Selected Attending user not found.", level=messages.ERROR)
                 return
 
-            with transaction.atomic():
-                updated = 0
-                for p in queryset.select_for_update():
-                    if p.attending_id != user.id:
-                        p._changed_by_user = request.user  # ensure audit 'changed_by'
-                        p.attending = user
-                        p.save(update_fields=["attending"])
-                        updated += 1
-                        if user.username != "to_be_assigned":
-                            self._notify_assignment(p, user)
+            changed = self._set_attending(request, queryset, user.pk)
+            updated = len(changed)
+            self._queue_assignment_notifications((p, user) for p in changed)
 
             display_name = user.get_full_name() or user.username
             self.message_user(
@@ -595,12 +889,19 @@ class PatientAdmin(admin.ModelAdmin):
             )
 
     # ---------- Read-only behavior for non-Active patients ----------
+    # Both variants are fixed per process; build them once instead of per form render
+    @cached_property
+    def _readonly_active(self) -> tuple[str, ...]:
+        return tuple(sorted({*self.readonly_fields, "age_years", "los_days", "admit_display"}))
+
+    @cached_property
+    def _readonly_locked(self) -> tuple[str, ...]:
+        return tuple(sorted({*self._readonly_active, *(f.attname for f in Patient._meta.concrete_fields)}))
+
     def get_readonly_fields(self, request, obj=None):
-        ro = list(super().get_readonly_fields(request, obj))
-        ro += ["age_years", "los_days", "admit_display"]
         if obj and obj.status != PatientStatus.ACTIVE:
-            ro += [f.attname for f in obj._meta.concrete_fields]
-        return tuple(sorted(set(ro)))
+            return self._readonly_locked
+        return self._readonly_active
 
     def has_delete_permission(self, request, obj=None):
         if obj and obj.status != PatientStatus.ACTIVE:
@@ -615,20 +916,15 @@ class PatientAdmin(admin.ModelAdmin):
     # ---------- Misc formatting ----------
     def get_changeform_initial_data(self, request):
         initial = super().get_changeform_initial_data(request)
-        try:
-            tba_user = UserModel.objects.get(username="to_be_assigned")
-            initial.setdefault("attending", tba_user.pk)
-        except UserModel.DoesNotExist:
-            pass
+        tba_pk = _tba_user_pk()
+        if tba_pk is not None:
+            initial.setdefault("attending", tba_pk)
         return initial
 
     def get_form(self, request, obj=None, **kwargs):
         form = super().get_form(request, obj, **kwargs)
         if "attending" in form.base_fields:
-            w = form.base_fields["attending"].widget
-            for attr in ("can_add_related", "can_change_related", "can_delete_related"):
-                if hasattr(w, attr):
-                    setattr(w, attr, False)
+            _disable_related(form.base_fields["attending"].widget)
         return form
 
     def save_model(self, request, obj, form, change):
@@ -638,17 +934,14 @@ class PatientAdmin(admin.ModelAdmin):
         """
         obj._changed_by_user = request.user  # ensure audit 'changed_by'
 
-        # Capture previous object (for status/attending diffs)
-        prev_attending = None
+        # Previous values (for status/attending diffs) straight from the bound form's
+        # initial data, which ModelForm built from the stored instance; no re-fetch.
+        # A field left out of the form (read-only) can't have changed.
+        prev_attending_id = None
         old_status = None
         if change and obj.pk:
-            try:
-                prev = Patient.objects.get(pk=obj.pk)
-                prev_attending = prev.attending
-                old_status = prev.status
-            except Patient.DoesNotExist:
-                prev_attending = None
-                old_status = None
+            prev_attending_id = form.initial.get("attending", obj.attending_id)
+            old_status = form.initial.get("status", obj.status)
 
         # If Status changed, set missing timestamps BEFORE saving
         if old_status != obj.status:
@@ -661,17 +954,19 @@ class PatientAdmin(admin.ModelAdmin):
 
         # After save: if attending changed, notify (skip placeholder)
         if change and "attending" in getattr(form, "changed_data", []):
-            new_attending = obj.attending
-            if new_attending and (not prev_attending or prev_attending.id != new_attending.id):
-                if getattr(new_attending, "username", None) != "to_be_assigned":
-                    self._notify_assignment(obj, new_attending)
+            if obj.attending_id and prev_attending_id != obj.attending_id:
+                self._queue_assignment_notifications([(obj, obj.attending)])
 
-    @admin.display(description="LOS (d)")
+    @admin.display(description="LOS (d)", ordering="_los_days")
     def los_days(self, obj: "Patient"):
+        if hasattr(obj, "_los_days"):
+            return obj._los_days or "—"
         return _calc_los(obj.admission_date, obj.admission_time) or "—"
 
     @admin.display(description="Admit", ordering="admission_date")
     def admit_display(self, obj: "Patient"):
+        if hasattr(obj, "_admit_display"):
+            return obj._admit_display or "—"
         if not obj.admission_date:
             return "—"
         if obj.admission_time:
@@ -685,6 +980,7 @@ class SignoutAdmin(admin.ModelAdmin):
     list_display = ("patient", "entry_date", "created_by", "created_at")
     list_filter = ("entry_date", "created_by")
     search_fields = ("patient__mrn", "patient__name", "text")
+    list_select_related = ("patient", "created_by")
     date_hierarchy = "entry_date"
     ordering = ("-entry_date", "-created_at")
 
@@ -693,23 +989,32 @@ class TodoAdmin(admin.ModelAdmin):
     list_display = ("patient", "text_short", "is_completed", "expires_at", "created_by", "created_at")
     list_filter = ("is_completed", "expires_at", "created_by")
     search_fields = ("patient__mrn", "patient__name", "text")
+    list_select_related = ("patient", "created_by")
     ordering = ("is_completed", "-created_at")
 
+    # Ship only the first 60 chars (+ length) for the list column, not the full note
+    def get_changelist(self, request, **kwargs):
+        return TodoChangeList
+
     @admin.display(description="Text")
     def text_short(self, obj: Todo):
-        return obj.text if len(obj.text) <= 60 else f"{obj.text[:57]}..."
+        return obj._text_head if obj._text_len <= 60 else f"{obj._text_head[:57]}..."
 
 @admin.register(OvernightEvent)
 class OvernightEventAdmin(admin.ModelAdmin):
     list_display = ("patient", "desc_short", "resolved", "created_at")
     list_filter = ("resolved", "created_at")
     search_fields = ("patient__mrn", "patient__name", "description")
+    list_select_related = ("patient",)
     date_hierarchy = "created_at"
     ordering = ("-created_at",)
 
+    def get_changelist(self, request, **kwargs):
+        return OvernightEventChangeList
+
     @admin.display(description="Description")
     def desc_short(self, obj: OvernightEvent):
-        return obj.description if len(obj.description) <= 60 else f"{obj.description[:57]}..."
+        return obj._description_head if obj._description_len <= 60 else f"{obj._description_head[:57]}..."
 
 # ========== Notifications Admin ==========
 
@@ -742,13 +1047,20 @@ class NotificationAdmin(admin.ModelAdmin):
         "patient__mrn",
         "patient__name",
     )
+    list_select_related = ("recipient", "acknowledged_by")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     actions = ["mark_as_read", "mark_as_unread"]
     date_hierarchy = "visible_at"
     ordering = ("-visible_at", "-created_at")
 
+    # Ship only the first 80 chars (+ length) for the list column, not the full body
+    def get_changelist(self, request, **kwargs):
+        return NotificationChangeList
+
     def short_message(self, obj):
-        msg = obj.message or ""
-        return (msg[:80] + "…") if len(msg) > 80 else msg
+        msg = obj._message_head or ""
+        return (msg + "…") if obj._message_len > 80 else msg
     short_message.short_description = "Message"
 
     def is_read_flag(self, obj):
@@ -758,14 +1070,36 @@ class NotificationAdmin(admin.ModelAdmin):
 
     @admin.action(description="Mark selected notifications as READ")
     def mark_as_read(self, request, queryset):
-        updated = queryset.filter(read_at__isnull=True).update(read_at=timezone.now())
+        queryset = queryset.filter(read_at__isnull=True)
+        recipient_ids = list(queryset.order_by().values_list("recipient_id", flat=True).distinct())
+        updated = queryset.update(read_at=timezone.now())
+        Notification.forget_badge_counts(recipient_ids)
         self.message_user(request, f"Marked {updated} notification(s) as read.")
 
     @admin.action(description="Mark selected notifications as UNREAD")
     def mark_as_unread(self, request, queryset):
+        recipient_ids = list(queryset.order_by().values_list("recipient_id", flat=True).distinct())
         updated = queryset.update(read_at=None)
+        Notification.forget_badge_counts(recipient_ids)
         self.message_user(request, f"Marked {updated} notification(s) as unread.")
 
+    # Change-form edits and deletes also move the cached badge/status counts
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # A reassigned notification affects the previous recipient too
+        Notification.forget_badge_counts(
+            [pk for pk in (obj.recipient_id, form.initial.get("recipient")) if pk]
+        )
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        Notification.forget_badge_counts([obj.recipient_id])
+
+    def delete_queryset(self, request, queryset):
+        recipient_ids = list(queryset.order_by().values_list("recipient_id", flat=True).distinct())
+        super().delete_queryset(request, queryset)
+        Notification.forget_badge_counts(recipient_ids)
+
 # ========== Assignments Admin (single registration) ==========
 
 class AssignmentAdmin(admin.ModelAdmin):
@@ -778,6 +1112,7 @@ class AssignmentAdmin(admin.ModelAdmin):
         "provider__first_name",
         "provider__last_name",
     )
+    list_select_related = ("patient", "provider")
     ordering = ("-start_date", "-created_at")
 
 try:
@@ -817,6 +1152,9 @@ class AuditLogAdmin(admin.ModelAdmin):
         "old_attending__username",
         "new_attending__username",
     )
+    list_select_related = ("patient", "changed_by", "old_attending", "new_attending")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     ordering = ("-created_at",)
 
     @admin.display(description="UA")
@@ -824,3 +1162,20 @@ class AuditLogAdmin(admin.ModelAdmin):
         ua = obj.user_agent or ""
         return ua if len(ua) <= 60 else f"{ua[:57]}…"
 
+# ========== Users Admin (attending autocomplete) ==========
+class AttendingUserAdmin(DjangoUserAdmin):
+    # Attending autocomplete: users type a last-name/username prefix, so match on
+    # prefixes (istartswith) instead of icontains across every user column.
+    autocomplete_search_fields = ("^last_name", "^first_name", "^username")
+
+    def get_search_fields(self, request):
+        match = getattr(request, "resolver_match", None)
+        if match and match.url_name == "autocomplete":
+            return self.autocomplete_search_fields
+        return super().get_search_fields(request)
+
+try:
+    admin.site.unregister(get_user_model())
+except NotRegistered:
+    pass
+admin.site.register(get_user_model(), AttendingUserAdmin)
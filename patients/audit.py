@@ -77,13 +77,15 @@ from .models import Patient  # reuse AuditLog already imported above
 def _audit_patient_attending_pre(sender, instance: Patient, **kwargs):
     """
     Capture the previous attending_id before save so post_save can compare.
+    Skips the lookup when update_fields shows attending isn't being written.
     """
-    if instance.pk:
-        try:
-            prev = Patient.objects.only("attending_id").get(pk=instance.pk)
-            instance.__prev_attending_id = prev.attending_id
-        except Patient.DoesNotExist:
-            instance.__prev_attending_id = None
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and not {"attending", "attending_id"} & set(update_fields):
+        instance.__prev_attending_id = instance.attending_id
+    elif instance.pk:
+        instance.__prev_attending_id = (
+            Patient.objects.filter(pk=instance.pk).values_list("attending_id", flat=True).first()
+        )
     else:
         instance.__prev_attending_id = None
 
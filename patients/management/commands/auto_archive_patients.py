@@ -4,6 +4,8 @@ from django.utils import timezone
 from django.conf import settings
 from patients.models import Patient, PatientStatus
 
+BATCH_SIZE = 10_000
+
 
 class Command(BaseCommand):
     help = "Auto-archive patients who have been discharged longer than the grace period."
@@ -18,10 +20,22 @@ class Command(BaseCommand):
             discharged_at__lte=cutoff,
         )
 
-        count = qs.count()
+        # Archive in pk-ordered batches (keyset, not OFFSET) so a large backlog is
+        # written as many short UPDATEs, each committed on its own, rather than one
+        # long statement holding every row lock. update() returns the rows it archived.
+        count = 0
+        last_pk = 0
+        while True:
+            batch = list(
+                qs.filter(pk__gt=last_pk).order_by("pk").values_list("pk", flat=True)[:BATCH_SIZE]
+            )
+            if not batch:
+                break
+            count += qs.filter(pk__in=batch).update(status=PatientStatus.ARCHIVED, archived_at=now)
+            last_pk = batch[-1]
+
         if count == 0:
             self.stdout.write(self.style.SUCCESS("No patients to archive."))
             return
 
-        qs.update(status=PatientStatus.ARCHIVED, archived_at=now)
         self.stdout.write(self.style.SUCCESS(f"Archived {count} patient(s)."))
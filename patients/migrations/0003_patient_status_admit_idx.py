@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0002_patient_trigram_search_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='patient',
+            index=models.Index(fields=['status', '-admission_date', '-admission_time'], name='patient_status_admit_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0003_patient_status_admit_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='signout',
+            index=models.Index(fields=['patient', 'entry_date'], name='patients_si_patient_1ae4a3_idx'),
+        ),
+    ]
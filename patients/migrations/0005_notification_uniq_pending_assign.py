@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0004_signout_patient_entry_date_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.UniqueConstraint(condition=models.Q(('category', 'assignment'), ('read_at__isnull', True)), fields=('patient', 'recipient', 'visible_at'), name='uniq_pending_assign_notif'),
+        ),
+    ]
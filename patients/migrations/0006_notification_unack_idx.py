@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0005_notification_uniq_pending_assign'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('acknowledged_at__isnull', True)), fields=['recipient', 'visible_at'], name='notify_unack_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:39
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction; building it this way
+    # doesn't block writes to patients while it runs.
+    atomic = False
+
+    dependencies = [
+        ('patients', '0006_notification_unack_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='patient',
+            index=models.Index(condition=models.Q(('status', 'DISCHARGED')), fields=['discharged_at'], name='patient_disch_sweep_idx'),
+        ),
+    ]
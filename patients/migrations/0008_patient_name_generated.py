@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:40
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0007_patient_disch_sweep_idx'),
+    ]
+
+    # A column can't be altered into a generated one: drop the stored name (and its
+    # index) and re-add it as GENERATED ALWAYS AS (...) STORED; Postgres fills it in.
+    operations = [
+        migrations.RemoveIndex(
+            model_name='patient',
+            name='patients_pa_name_8d04ea_idx',
+        ),
+        migrations.RemoveField(
+            model_name='patient',
+            name='name',
+        ),
+        migrations.AddField(
+            model_name='patient',
+            name='name',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Trim(django.db.models.functions.text.Concat(models.Case(models.When(models.Q(('last_name__regex', '\\S'), ('first_name__regex', '\\S')), then=django.db.models.functions.text.Concat(django.db.models.functions.text.Trim('last_name'), models.Value(', '), django.db.models.functions.text.Trim('first_name'))), models.When(last_name__regex='\\S', then=django.db.models.functions.text.Trim('last_name')), default=django.db.models.functions.text.Trim('first_name')), models.Case(models.When(models.Q(('middle_name', ''), _negated=True), then=django.db.models.functions.text.Concat(models.Value(' '), django.db.models.functions.text.Trim('middle_name'))), default=models.Value('')), models.Case(models.When(models.Q(('suffix', ''), _negated=True), then=django.db.models.functions.text.Concat(models.Value(', '), django.db.models.functions.text.Trim('suffix'))), default=models.Value('')))), output_field=models.CharField(max_length=200)),
+        ),
+        migrations.AddIndex(
+            model_name='patient',
+            index=models.Index(fields=['name'], name='patients_pa_name_8d04ea_idx'),
+        ),
+    ]
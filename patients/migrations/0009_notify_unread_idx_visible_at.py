@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:41
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # (CREATE|DROP) INDEX CONCURRENTLY can't run inside a transaction; this way
+    # notification inserts aren't blocked while the index is rebuilt. The new index
+    # is built under a temporary name first, so the unread/badge queries always have
+    # a partial index to use, then swapped in by name.
+    atomic = False
+
+    dependencies = [
+        ('patients', '0008_patient_name_generated'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('read_at__isnull', True)), fields=['recipient', 'visible_at'], name='notify_unread_idx_new'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='notification',
+            name='notify_unread_idx',
+        ),
+        migrations.RenameIndex(
+            model_name='notification',
+            new_name='notify_unread_idx',
+            old_name='notify_unread_idx_new',
+        ),
+    ]
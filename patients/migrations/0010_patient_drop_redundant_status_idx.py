@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0009_notify_unread_idx_visible_at'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='patient',
+            name='patients_pa_status_ca3fc5_idx',
+        ),
+        migrations.AlterField(
+            model_name='patient',
+            name='status',
+            field=models.CharField(choices=[('ACTIVE', 'Active'), ('DISCHARGED', 'Discharged'), ('ARCHIVED', 'Archived')], default='ACTIVE', max_length=16),
+        ),
+    ]
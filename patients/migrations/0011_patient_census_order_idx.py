@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:47
+
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # (CREATE|DROP) INDEX CONCURRENTLY can't run inside a transaction; this way
+    # writes to patients aren't blocked while the index is swapped.
+    atomic = False
+
+    dependencies = [
+        ('patients', '0010_patient_drop_redundant_status_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='patient',
+            index=models.Index(fields=['-admission_date', '-admission_time', '-created_at'], name='patient_census_order_idx'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='patient',
+            name='patients_pa_admissi_92123e_idx',
+        ),
+    ]
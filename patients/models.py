@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from datetime import datetime
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.core.cache import cache
 from django.db import models
-from django.db.models import Q
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.functions import Coalesce, Concat, Trim, Upper
 from django.utils import timezone
 
 
@@ -23,6 +26,40 @@ class PatientStatus(models.TextChoices):
     ARCHIVED = "ARCHIVED", "Archived"
 
 
+class PatientManager(models.Manager):
+    """
+    Set-based counterparts of Patient.discharge()/archive() for bulk flows: one
+    UPDATE for the given pks instead of a save() per patient. Rows already in the
+    target state are skipped, and the lifecycle timestamp is stamped once
+    (COALESCE keeps an existing value). Like any update(), no signals fire.
+    Return rows updated.
+    """
+
+    def discharge(self, pks, when: datetime | None = None) -> int:
+        when = when or timezone.now()
+        return (
+            self.filter(pk__in=pks)
+            .exclude(status=PatientStatus.DISCHARGED)
+            .update(
+                status=PatientStatus.DISCHARGED,
+                discharged_at=Coalesce(F("discharged_at"), Value(when)),
+                updated_at=when,
+            )
+        )
+
+    def archive(self, pks, when: datetime | None = None) -> int:
+        when = when or timezone.now()
+        return (
+            self.filter(pk__in=pks)
+            .exclude(status=PatientStatus.ARCHIVED)
+            .update(
+                status=PatientStatus.ARCHIVED,
+                archived_at=Coalesce(F("archived_at"), Value(when)),
+                updated_at=when,
+            )
+        )
+
+
 class Patient(models.Model):
     # Core identifiers & demographics
     mrn = models.CharField(max_length=50, blank=True, null=True)
@@ -33,8 +70,25 @@ class Patient(models.Model):
     middle_name = models.CharField(max_length=100, blank=True)
     suffix = models.CharField(max_length=50, blank=True)
 
-    # Legacy combined name (kept during transition; auto-synced in save())
-    name = models.CharField(max_length=200)
+    # Legacy combined name (kept during transition): "Last, First Middle, Suffix",
+    # built by Postgres as a stored generated column so it also stays in sync
+    # through update()/bulk paths that skip save().
+    name = models.GeneratedField(
+        expression=Trim(
+            Concat(
+                Case(
+                    When(Q(last_name__regex=r"\S") & Q(first_name__regex=r"\S"),
+                         then=Concat(Trim("last_name"), Value(", "), Trim("first_name"))),
+                    When(last_name__regex=r"\S", then=Trim("last_name")),
+                    default=Trim("first_name"),
+                ),
+                Case(When(~Q(middle_name=""), then=Concat(Value(" "), Trim("middle_name"))), default=Value("")),
+                Case(When(~Q(suffix=""), then=Concat(Value(", "), Trim("suffix"))), default=Value("")),
+            )
+        ),
+        output_field=models.CharField(max_length=200),
+        db_persist=True,
+    )
 
     dob = models.DateField("Date of Birth")
     sex = models.CharField(max_length=1, choices=SEX_CHOICES, default="U")
@@ -67,7 +121,6 @@ class Patient(models.Model):
         max_length=16,
         choices=PatientStatus.choices,
         default=PatientStatus.ACTIVE,
-        db_index=True,
     )
     discharged_at = models.DateTimeField(null=True, blank=True)
     archived_at = models.DateTimeField(null=True, blank=True)
@@ -76,19 +129,7 @@ class Patient(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    # Keep legacy "name" field in sync for backward compatibility
-    def save(self, *args, **kwargs):
-        parts = [
-            (self.last_name or "").strip(),
-            (self.first_name or "").strip(),
-        ]
-        full = ", ".join([p for p in parts if p])  # "Last, First"
-        if self.middle_name:
-            full += f" {self.middle_name.strip()}"
-        if self.suffix:
-            full += f", {self.suffix.strip()}"
-        self.name = full.strip()
-        super().save(*args, **kwargs)
+    objects = PatientManager()
 
     # Computed age in full years from DOB (read-only; not stored in DB)
     @property
@@ -105,9 +146,23 @@ class Patient(models.Model):
         indexes = [
             models.Index(fields=["mrn"]),
             models.Index(fields=["name"]),
-            models.Index(fields=["admission_date", "admission_time"]),
+            # Default list ordering (Meta.ordering); also serves admission_date ranges
+            models.Index(fields=["-admission_date", "-admission_time", "-created_at"], name="patient_census_order_idx"),
             models.Index(fields=["attending"]),
-            models.Index(fields=["status"]),
+            # Default admin census: status=ACTIVE ordered by newest admission.
+            # Also serves plain status filters (status is the leading column).
+            models.Index(fields=["status", "-admission_date", "-admission_time"], name="patient_status_admit_idx"),
+            # Nightly auto-archive sweep: DISCHARGED rows by discharged_at cutoff
+            models.Index(
+                fields=["discharged_at"],
+                name="patient_disch_sweep_idx",
+                condition=Q(status=PatientStatus.DISCHARGED),
+            ),
+            # Trigram indexes for admin search (icontains -> UPPER(col) LIKE '%q%')
+            GinIndex(OpClass(Upper("mrn"), name="gin_trgm_ops"), name="patient_mrn_trgm"),
+            GinIndex(OpClass(Upper("last_name"), name="gin_trgm_ops"), name="patient_last_name_trgm"),
+            GinIndex(OpClass(Upper("first_name"), name="gin_trgm_ops"), name="patient_first_name_trgm"),
+            GinIndex(OpClass(Upper("diagnosis"), name="gin_trgm_ops"), name="patient_diagnosis_trgm"),
         ]
 
     def __str__(self) -> str:
@@ -158,6 +213,10 @@ class Signout(models.Model):
 
     class Meta:
         ordering = ("-entry_date", "-created_at")
+        indexes = [
+            # Per-patient signout lists (admin inline orders by entry_date)
+            models.Index(fields=["patient", "entry_date"]),
+        ]
 
     def __str__(self) -> str:
         return f"Signout {self.patient.mrn} @ {self.entry_date}"
@@ -238,6 +297,18 @@ class Assignment(models.Model):
 # -------------------------------
 # In-App Notifications (P6-C2)
 # -------------------------------
+class NotificationManager(models.Manager):
+    def mark_all_read(self, user, when: datetime | None = None) -> int:
+        """
+        Mark all of user's notifications visible by `when` (default now) as read in
+        one UPDATE; still-pending quiet-hours items are left alone. Returns rows updated.
+        """
+        when = when or timezone.now()
+        updated = self.filter(recipient=user, visible_at__lte=when, read_at__isnull=True).update(read_at=when)
+        self.model.forget_badge_counts([user.pk])
+        return updated
+
+
 class Notification(models.Model):
     class Level(models.TextChoices):
         INFO = "info", "Info"
@@ -289,6 +360,8 @@ class Notification(models.Model):
         related_name="acknowledged_notifications",
     )
 
+    objects = NotificationManager()
+
     @property
     def is_acknowledged(self) -> bool:
         return self.acknowledged_at is not None
@@ -302,10 +375,25 @@ class Notification(models.Model):
             models.Index(fields=["category", "patient", "visible_at"]),  # for dedupe checks
             # PostgreSQL partial index for fast "unread" lookups:
             models.Index(
-                fields=["recipient"],
+                fields=["recipient", "visible_at"],
                 name="notify_unread_idx",
                 condition=Q(read_at__isnull=True),
             ),
+            # ...and its counterpart for the "unacknowledged" header badge:
+            models.Index(
+                fields=["recipient", "visible_at"],
+                name="notify_unack_idx",
+                condition=Q(acknowledged_at__isnull=True),
+            ),
+        ]
+        constraints = [
+            # At most one unread assignment notification per patient/recipient/delivery
+            # time, so concurrent (re)assignments can't queue duplicates.
+            models.UniqueConstraint(
+                fields=["patient", "recipient", "visible_at"],
+                condition=Q(category="assignment", read_at__isnull=True),
+                name="uniq_pending_assign_notif",
+            ),
         ]
 
     def __str__(self) -> str:
@@ -315,37 +403,96 @@ class Notification(models.Model):
     def is_read(self) -> bool:
         return self.read_at is not None
 
+    # Per-user header/page counts cached by the notification_badges template tag.
+    # The short TTL also bounds how late a quiet-hours (future visible_at) item shows up.
+    BADGE_CACHE_TTL = 30  # seconds
+    STATUS_CACHE_TTL = 5  # seconds; polled by every open page
+
+    @staticmethod
+    def badge_cache_key(recipient_id: int) -> str:
+        return f"notif_badge:{recipient_id}"
+
+    @staticmethod
+    def status_cache_key(recipient_id: int) -> str:
+        return f"notif_status:{recipient_id}"
+
+    @classmethod
+    def forget_badge_counts(cls, recipient_ids) -> None:
+        """
+        Drop cached badge counts and polling status for these users
+        (call after changing their notifications).
+        """
+        keys = []
+        for pk in set(recipient_ids):
+            keys += [cls.badge_cache_key(pk), cls.status_cache_key(pk)]
+        cache.delete_many(keys)
+
     def mark_read(self, when: datetime | None = None) -> None:
         self.read_at = when or timezone.now()
         self.save(update_fields=["read_at"])
+        self.forget_badge_counts([self.recipient_id])
 
     def mark_unread(self) -> None:
         self.read_at = None
         self.save(update_fields=["read_at"])
+        self.forget_badge_counts([self.recipient_id])
 
     @classmethod
     def push(
         cls,
         *,
-        recipient,
+        recipient=None,
         message: str,
         level: str = Level.INFO,
         patient: Patient | None = None,
         visible_at: datetime | None = None,
         category: str = Category.GENERIC,   # CHANGED from kind
+        recipient_id: int | None = None,
+        patient_id: int | None = None,
     ) -> "Notification":
         """
         Centralized creator for notifications. In the future, you can also fan-out here
         (e.g., SMS/email) without changing callers.
+
+        Callers that only hold ids can pass recipient_id / patient_id instead of
+        the objects (one of recipient / recipient_id is required).
         """
-        return cls.objects.create(
-            recipient=recipient,
+        if (recipient is None) == (recipient_id is None):
+            raise ValueError("Pass exactly one of recipient / recipient_id.")
+        if patient is not None and patient_id is not None:
+            raise ValueError("Pass at most one of patient / patient_id.")
+        notification = cls.objects.create(
+            recipient_id=recipient.pk if recipient is not None else recipient_id,
             message=message,
             level=level,
-            patient=patient,
+            patient_id=patient.pk if patient is not None else patient_id,
             visible_at=visible_at or timezone.now(),
             category=category,              # CHANGED from kind=kind
         )
+        cls.forget_badge_counts([notification.recipient_id])
+        return notification
+
+    @classmethod
+    def push_many(
+        cls,
+        items: list[dict],
+        batch_size: int = 500,
+        ignore_conflicts: bool = False,
+    ) -> list["Notification"]:
+        """
+        Bulk counterpart of push(): each item takes push()'s keyword arguments
+        (recipient/patient or recipient_id/patient_id).
+        One INSERT per batch_size rows; ignore_conflicts skips rows that would
+        violate a unique constraint (ON CONFLICT DO NOTHING).
+        """
+        now = timezone.now()
+        notifications = cls.objects.bulk_create(
+            [cls(**{**item, "visible_at": item.get("visible_at") or now}) for item in items],
+            batch_size=batch_size,
+            ignore_conflicts=ignore_conflicts,
+        )
+        cls.forget_badge_counts(n.recipient_id for n in notifications)
+        return notifications
 
 
 
@@ -0,0 +1,75 @@
+# patients/templatetags/notifications.py
+from django import template
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from ..models import Notification
+
+register = template.Library()
+
+# Shared, read-only result for anonymous users / requests without a user.
+_ZERO = {
+    "unread_count": 0,   # for page UI (e.g., "Mark all as read")
+    "badge_count": 0,    # for header badge (unacknowledged)
+    "has_unack": False,  # for "anything to acknowledge?" checks that show no number
+}
+
+
+@register.simple_tag(takes_context=True)
+def notification_badges(context):
+    """
+    Notification counts for the current user, for templates that show them:
+      - unread_count: unread (read_at IS NULL) among notifications visible now.
+      - badge_count: unacknowledged (acknowledged_at IS NULL) among notifications visible now.
+      - has_unack: badge_count > 0; use it where only presence matters.
+    Usage: {% load notifications %}{% notification_badges as badges %}{{ badges.unread_count }}
+
+    A template tag rather than a context processor, so pages that never render the
+    header (JSON, partial HTML) don't pay for it. Computed once per request, cached
+    per user for Notification.BADGE_CACHE_TTL seconds and dropped whenever that
+    user's notifications change (see Notification.forget_badge_counts).
+    """
+    request = context.get("request")
+    if request is None:
+        return _ZERO
+    user = request.user  # AuthenticationMiddleware always sets it
+    if not user.is_authenticated:
+        return _ZERO
+    if not hasattr(request, "_notification_badges"):
+        request._notification_badges = _badges(user)
+    return request._notification_badges
+
+
+def _badges(user) -> dict[str, int]:
+    key = Notification.badge_cache_key(user.pk)
+    counts = cache.get(key)
+    if counts is None:
+        counts = _badge_counts(user)
+        cache.set(key, counts, Notification.BADGE_CACHE_TTL)
+
+    return {
+        "unread_count": counts["unread"],
+        "badge_count": counts["unack"],
+        # Derived from the cached aggregate rather than a separate EXISTS query.
+        "has_unack": counts["unack"] > 0,
+    }
+
+
+def _badge_counts(user) -> dict[str, int]:
+    now = timezone.now()
+
+    # One round-trip for both counts. Restricting to rows that are unread OR
+    # unacknowledged lets Postgres combine the two partial indexes
+    # (notify_unread_idx / notify_unack_idx) instead of walking the user's history.
+    return (
+        Notification.objects
+        .filter(recipient=user, visible_at__lte=now)
+        .filter(Q(read_at__isnull=True) | Q(acknowledged_at__isnull=True))
+        .aggregate(
+            # Page UI: unread by read_at
+            unread=Count("id", filter=Q(read_at__isnull=True)),
+            # Header badge: unacknowledged by acknowledged_at
+            unack=Count("id", filter=Q(acknowledged_at__isnull=True)),
+        )
+    )
@@ -1,3 +1,166 @@
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import AuditLog, Notification, Patient, PatientWatch
+
+
+class ToggleWatchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.user = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        cls.patient = Patient.objects.create(
+            mrn="M1", last_name="Doe", first_name="Jane", dob=date(1980, 1, 1), attending=cls.user,
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.url = reverse("admin:patients_patient_toggle_watch", args=[self.patient.pk])
+        # Start from a clean slate (the attending may have been auto-watched on create)
+        PatientWatch.objects.filter(user=self.user, patient=self.patient).delete()
+
+    def _watches(self):
+        return PatientWatch.objects.filter(user=self.user, patient=self.patient)
+
+    def test_unwatch_with_archived_history(self):
+        old = timezone.now() - timedelta(days=2)
+        PatientWatch.objects.create(user=self.user, patient=self.patient, archived_at=old)
+        PatientWatch.objects.create(user=self.user, patient=self.patient)
+
+        self.assertEqual(self.client.get(self.url).status_code, 302)
+        self.assertFalse(self._watches().filter(archived_at__isnull=True).exists())
+        self.assertEqual(self._watches().count(), 2)
+
+    def test_rewatch_reactivates_newest_archived_only(self):
+        now = timezone.now()
+        older = PatientWatch.objects.create(user=self.user, patient=self.patient, archived_at=now - timedelta(days=2))
+        newer = PatientWatch.objects.create(user=self.user, patient=self.patient, archived_at=now - timedelta(days=1))
+
+        self.assertEqual(self.client.get(self.url).status_code, 302)
+        active = self._watches().filter(archived_at__isnull=True)
+        self.assertEqual(list(active.values_list("pk", flat=True)), [newer.pk])
+        older.refresh_from_db()
+        self.assertIsNotNone(older.archived_at)
+
+    def test_watch_creates_when_missing(self):
+        self.assertEqual(self.client.get(self.url).status_code, 302)
+        self.assertEqual(self._watches().filter(archived_at__isnull=True).count(), 1)
+
+
+class AddToWatchlistActionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.user = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        cls.patient = Patient.objects.create(
+            mrn="M1", last_name="Doe", first_name="Jane", dob=date(1980, 1, 1), attending=cls.user,
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        PatientWatch.objects.filter(user=self.user, patient=self.patient).delete()
+
+    def _add(self):
+        return self.client.post(
+            reverse("admin:patients_patient_changelist"),
+            {"action": "add_to_my_watchlist", "_selected_action": [self.patient.pk]},
+        )
+
+    def test_reactivates_newest_archived_only(self):
+        now = timezone.now()
+        older = PatientWatch.objects.create(user=self.user, patient=self.patient, archived_at=now - timedelta(days=2))
+        newer = PatientWatch.objects.create(user=self.user, patient=self.patient, archived_at=now - timedelta(days=1))
+
+        self.assertEqual(self._add().status_code, 302)
+        active = PatientWatch.objects.filter(user=self.user, patient=self.patient, archived_at__isnull=True)
+        self.assertEqual(list(active.values_list("pk", flat=True)), [newer.pk])
+        older.refresh_from_db()
+        self.assertIsNotNone(older.archived_at)
+
+    def test_skips_already_active(self):
+        PatientWatch.objects.create(user=self.user, patient=self.patient)
+        PatientWatch.objects.create(user=self.user, patient=self.patient, archived_at=timezone.now())
+
+        self.assertEqual(self._add().status_code, 302)
+        self.assertEqual(
+            PatientWatch.objects.filter(user=self.user, patient=self.patient, archived_at__isnull=True).count(), 1
+        )
+
+
+class SetAttendingActionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.admin = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        cls.tba = User.objects.create_user("to_be_assigned", first_name="TO BE", last_name="ASSIGNED")
+        cls.doc = User.objects.create_user("doc", first_name="Greg", last_name="House")
+        cls.other = User.objects.create_user("other", first_name="Lisa", last_name="Cuddy")
+        cls.unassigned = cls._patient("M1", cls.tba)
+        cls.already_doc = cls._patient("M2", cls.doc)
+        cls.with_other = cls._patient("M3", cls.other)
+
+    @classmethod
+    def _patient(cls, mrn, attending):
+        return Patient.objects.create(
+            mrn=mrn, last_name="Doe", first_name="Jane", dob=date(1980, 1, 1), attending=attending,
+        )
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def _run(self, patients, **data):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            response = self.client.post(
+                reverse("admin:patients_patient_changelist"),
+                {
+                    "action": "bulk_set_or_clear_attending",
+                    "_selected_action": [p.pk for p in patients],
+                    **data,
+                },
+            )
+        self.assertEqual(response.status_code, 302)
+        return callbacks
+
+    def _changes(self):
+        return AuditLog.objects.filter(event=AuditLog.Event.ATTENDING_CHANGED)
+
+    def test_assign_audits_changed_patients_only(self):
+        self._run([self.unassigned, self.already_doc, self.with_other], attending=self.doc.pk)
+
+        rows = {a.patient_id: a for a in self._changes()}
+        self.assertEqual(set(rows), {self.unassigned.pk, self.with_other.pk})
+        self.assertEqual(rows[self.unassigned.pk].old_attending_id, self.tba.pk)
+        self.assertEqual(rows[self.with_other.pk].old_attending_id, self.other.pk)
+        for row in rows.values():
+            self.assertEqual(row.new_attending_id, self.doc.pk)
+            self.assertEqual(row.changed_by_id, self.admin.pk)
+        self.assertEqual(
+            Patient.objects.filter(attending=self.doc).count(), 3,
+        )
+
+    def test_assign_notifies_after_commit(self):
+        callbacks = self._run([self.unassigned, self.already_doc, self.with_other], attending=self.doc.pk)
+
+        # Nothing is sent until the surrounding transaction commits
+        self.assertFalse(Notification.objects.exists())
+        for callback in callbacks:
+            callback()
+        sent = Notification.objects.filter(recipient=self.doc, category=Notification.Category.ASSIGNMENT)
+        self.assertEqual(
+            set(sent.values_list("patient_id", flat=True)), {self.unassigned.pk, self.with_other.pk},
+        )
+
+    def test_clear_audits_but_does_not_notify(self):
+        callbacks = self._run([self.already_doc, self.unassigned], clear_attending="on")
+        for callback in callbacks:
+            callback()
 
-# Create your tests here.
+        rows = list(self._changes())
+        self.assertEqual([r.patient_id for r in rows], [self.already_doc.pk])
+        self.assertEqual(rows[0].new_attending_id, self.tba.pk)
+        self.assertEqual(rows[0].changed_by_id, self.admin.pk)
+        self.assertFalse(Notification.objects.exists())
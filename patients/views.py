@@ -3,9 +3,11 @@ from django.contrib.auth.decorators import login_required
 from django.views.decorators.http import require_POST
 from django.shortcuts import get_object_or_404, redirect
 from django.http import HttpResponse, JsonResponse
+from django.core.cache import cache
 from django.utils import timezone
 from django.template import loader, TemplateDoesNotExist
-from django.db.models import BooleanField, Case, When, Value, Max
+from django.db.models import Case, Count, When, Value, Max, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from django.utils.timezone import localtime
 
@@ -30,21 +32,22 @@ def notifications_list(request):
     qs = (
         Notification.objects
         .filter(recipient=request.user, visible_at__lte=now)
-        .annotate(
-            is_unread=Case(
-                When(read_at__isnull=True, then=Value(True)),
-                default=Value(False),
-                output_field=BooleanField(),
-            )
-        )
         # If your template shows patient info, this helps avoid extra queries:
         .select_related("patient")
+        # Only the columns the list templates render
+        .only(
+            "id", "level", "message", "visible_at", "created_at", "read_at",
+            "patient__mrn", "patient__name",
+        )
     )
 
     if show == "unread":
-        qs = qs.filter(read_at__isnull=True)
-
-    qs = qs.order_by("-is_unread", "-visible_at", "-created_at")
+        # Every row is unread: plain newest-first, which notify_unread_idx can serve
+        qs = qs.filter(read_at__isnull=True).order_by("-visible_at", "-created_at")
+    else:
+        # Unread first, sorted on the expression directly (no selected is_unread column)
+        unread_first = Case(When(read_at__isnull=True, then=Value(0)), default=Value(1))
+        qs = qs.order_by(unread_first, "-visible_at", "-created_at")
 
     # ---- Pagination ----
     page = request.GET.get("page", 1)
@@ -117,6 +120,7 @@ def notification_ack(request, pk: int):
         n.acknowledged_at = timezone.now()
         n.acknowledged_by = request.user
         n.save(update_fields=["acknowledged_at", "acknowledged_by"])
+        Notification.forget_badge_counts([n.recipient_id])
 
     return JsonResponse({
         "ok": True,
@@ -132,10 +136,7 @@ def notifications_mark_all_read(request):
     Mark all of the current user's *visible* notifications as read.
     (visible_at <= now, read_at IS NULL)
     """
-    now = timezone.now()
-    (Notification.objects
-        .filter(recipient=request.user, visible_at__lte=now, read_at__isnull=True)
-        .update(read_at=now))
+    Notification.objects.mark_all_read(request.user)
     return redirect("patients:notifications_list")
 
 
@@ -148,28 +149,45 @@ def notification_status(request):
       - latest_ts: most recent visibility time (to detect new since last check)
       - latest_message: the message of that latest notification (for toast)
       - server_now: server time (helps client-side drift)
+
+    Everything but server_now is cached per user for Notification.STATUS_CACHE_TTL
+    seconds and dropped when the user's notifications change.
     """
     now = timezone.now()
 
-    # Only consider notifications that are visible now
-    visible_qs = Notification.objects.filter(recipient=request.user, visible_at__lte=now)
+    key = Notification.status_cache_key(request.user.pk)
+    payload = cache.get(key)
+    if payload is None:
+        # Only consider notifications that are visible now
+        visible_qs = Notification.objects.filter(recipient=request.user, visible_at__lte=now)
+
+        # Unread = visible and read_at is null (legacy meaning)
+        unread_sq = (
+            visible_qs.filter(read_at__isnull=True)
+            .order_by()
+            .values("recipient")
+            .annotate(n=Count("id"))
+            .values("n")
+        )
 
-    # Unread = visible and read_at is null (legacy meaning)
-    unread_count = visible_qs.filter(read_at__isnull=True).count()
+        # Prefer latest by visible_at (fallback to created_at); the unread count
+        # rides along as a scalar subquery so this is a single round-trip.
+        latest_obj = (
+            visible_qs.order_by("-visible_at", "-created_at")
+            .values("visible_at", "message")
+            .annotate(unread=Coalesce(Subquery(unread_sq), 0))
+            .first()
+        )
 
-    # Prefer latest by visible_at (fallback to created_at)
-    latest_obj = (
-        visible_qs.order_by("-visible_at", "-created_at")
-        .values("visible_at", "message")
-        .first()
-    )
+        payload = {
+            # No visible rows at all means nothing unread either
+            "unread_count": latest_obj["unread"] if latest_obj else 0,
+            "latest_ts": latest_obj["visible_at"].isoformat() if latest_obj else None,
+            "latest_message": latest_obj["message"] if latest_obj else None,
+        }
+        cache.set(key, payload, Notification.STATUS_CACHE_TTL)
 
-    return JsonResponse({
-        "unread_count": unread_count,
-        "latest_ts": latest_obj["visible_at"].isoformat() if latest_obj else None,
-        "latest_message": latest_obj["message"] if latest_obj else None,
-        "server_now": now.isoformat(),
-    })
+    return JsonResponse({**payload, "server_now": now.isoformat()})
 
 
 # === API (NEW): unified global JSON feed for toasts/modals ===
@@ -189,7 +207,10 @@ def notifications_feed(request):
       }
     """
     now = timezone.now()
-    since_id = request.GET.get("since_id")
+    try:
+        since_id = int(request.GET.get("since_id") or 0)
+    except ValueError:
+        since_id = 0
 
     qs = (
         Notification.objects
@@ -197,8 +218,8 @@ def notifications_feed(request):
         .order_by("-id")
     )
 
-    if since_id and str(since_id).isdigit():
-        qs = qs.filter(id__gt=int(since_id))
+    if since_id > 0:
+        qs = qs.filter(id__gt=since_id)
 
     # Cap payload and return oldest→newest for natural reading
     items = list(qs[:20].values("id", "level", "category", "message", "created_at", "visible_at"))
@@ -211,22 +232,19 @@ def notifications_feed(request):
         it["created_at"] = localtime(ca).isoformat() if ca else None
         it["visible_at"] = localtime(va).isoformat() if va else None
 
-    # Count of visible & unacknowledged (badge semantics for unified client)
-    unack_count = (
-        Notification.objects
-        .filter(recipient=request.user, visible_at__lte=now, acknowledged_at__isnull=True)
-        .count()
-    )
-
-    # Latest id for THIS USER (not global)
-    latest_id = (
+    # One pass over this user's rows for both:
+    #   - unack: visible & unacknowledged (badge semantics for unified client)
+    #   - latest_id: newest id for THIS USER (not global)
+    agg = (
         Notification.objects
         .filter(recipient=request.user)
-        .aggregate(max_id=Max("id"))
-        .get("max_id")
+        .aggregate(
+            latest_id=Max("id"),
+            unack=Count("id", filter=Q(visible_at__lte=now, acknowledged_at__isnull=True)),
+        )
     )
 
     return JsonResponse(
-        {"items": items, "unread_count": unack_count, "latest_id": latest_id},
+        {"items": items, "unread_count": agg["unack"], "latest_id": agg["latest_id"]},
         status=200,
     )